@@ -19,6 +19,10 @@ acq400.py interface to one acq400 appliance instance
 
 import threading
 import re
+import selectors
+import select
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import os
 import errno
@@ -34,6 +38,53 @@ import numpy as np
 import socket
 import timeit
 import time
+import types
+
+_nb = None       # optional numba kernels, see _numba()
+
+def _numba():
+    """optional numba kernels, numpy is the fallback.
+
+    numba is imported on first use, so import acq400_hapi does not pay the numba/LLVM start up.
+
+    Returns:
+        namespace of kernels: volts, scale_volts, find_es. False when numba is not installed
+    """
+    global _nb
+    if _nb is not None:
+        return _nb
+    try:
+        from numba import njit, prange
+    except ImportError:
+        _nb = False
+        return _nb
+
+    # no fastmath: results must match the numpy path
+    @njit(parallel=True, cache=True)
+    def volts(raw, eslo, eoff, out):
+        for i in prange(raw.shape[0]):
+            out[i] = raw[i] * eslo + eoff
+
+    @njit(parallel=True, cache=True)
+    def scale_volts(raw, rshift, eslo, eoff, out):
+        nchan = eslo.shape[0]
+        for i in prange(raw.shape[0]):
+            ch = i % nchan
+            out[i] = (raw[i] >> rshift) * eslo[ch] + eoff[ch]
+
+    @njit(cache=True, boundscheck=False)
+    def find_es(u32, nchan):
+        # sample index of every event sample: marker in the first word of the sample
+        out = np.empty(u32.shape[0]//nchan, np.int64)
+        k = 0
+        for i in range(0, out.shape[0]*nchan, nchan):
+            if u32[i] == np.uint32(0xaa55f154):
+                out[k] = i//nchan
+                k += 1
+        return out[:k]
+
+    _nb = types.SimpleNamespace(volts=volts, scale_volts=scale_volts, find_es=find_es)
+    return _nb
 
 class DataNotAvailableError(Exception):
     pass
@@ -91,7 +142,7 @@ class AcqSites:
     SITE_DSP = 14
     SITE_HUDP = 10
 
-class SF:
+class SF(IntEnum):
     """uut system state constants"""
     STATE = 0
     PRE = 1
@@ -99,7 +150,7 @@ class SF:
     ELAPSED = 3
     DEMUX = 5
 
-class STATE:
+class STATE(IntEnum):
     """transient state constants"""
     IDLE = 0
     ARM = 1
@@ -109,32 +160,24 @@ class STATE:
     CLEANUP = 5
     @staticmethod
     def str(st):
-        if st==STATE.IDLE:
-            return "IDLE"
-        if st==STATE.ARM:
-            return "ARM"
-        if st==STATE.RUNPRE:
-            return "RUNPRE"
-        if st==STATE.RUNPOST:
-            return "RUNPOST"
-        if st==STATE.POPROCESS:
-            return "POPROCESS"
-        if st==STATE.CLEANUP:
-            return "CLEANUP"
-        return "UNDEF"
+        return _STATE_NAMES.get(st, "UNDEF")
+
+_STATE_NAMES = {int(st): st.name for st in STATE}
 
 class Signals:
     EXT_TRG_DX = 'd0'
     INT_TRG_DX = 'd1'
     MB_CLK_DX = 'd1'
 
-class StreamClient(netclient.Netclient):
-    """handles live streaming data"""
-    def __init__(self, addr):
-        print("worktodo")
-
 class RawClient(netclient.Netclient):
     """ handles raw data from any service port"""
+    # SO_RCVBUF only when asked for: on Linux setting it locks the buffer and disables
+    # receive window autotuning, which normally grows well beyond rmem_max
+    rcvbuf = int(os.getenv("ACQ400_RCVBUF", 0))
+    recv_chunk = int(os.getenv("ACQ400_RECV_CHUNK", 256*1024))
+    # bounded reads: kernel blocks until the buffer is full, one wakeup instead of one per segment
+    recv_flags = 0 if sys.platform == "win32" else getattr(socket, "MSG_WAITALL", 0)
+
     def __init__(self, addr, port):
         """init RawClient
 
@@ -144,41 +187,67 @@ class RawClient(netclient.Netclient):
         """
         netclient.Netclient.__init__(self, addr, port)
 
-    def read(self, nelems, data_size=2):
+    def read(self, nelems, data_size=2, out=None):
         """read data from channel data server
 
         Args:
-            nelems (int): data elements 
+            nelems (int): data elements, <= 0 : read to end of file
             data_size (int, optional): data size in bytes 2|4 short or int. Defaults to 2.
+            out (ndarray, optional): contiguous buffer of at least nelems elements to receive into, \
+            reused by the caller. Defaults to None (new array).
         Returns:
-            ndarray: channel data
+            ndarray: channel data, a view of out if supplied
         """
         _dtype = np.dtype('i4' if data_size == 4 else 'i2')   # hmm, what if unsigned?
 
-        buf = bytearray(nelems*data_size)
-        try:
-            view = memoryview(buf).cast('B')
-        except:
-            # python 2.7 hack
-            view = memoryview(buf)
+        if nelems <= 0:
+            # unknown length: collect chunks, join once at the end
+            chunks = []
+            while True:
+                chunk = self.sock.recv(self.recv_chunk)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            buf = bytearray().join(chunks)
+            return np.frombuffer(buf, _dtype, count=len(buf)//_dtype.itemsize)
+
+        # receive straight into the array that is returned, no copy
+        if out is None:
+            out = np.empty(nelems, _dtype)
+        else:
+            out = out.reshape(-1)[:nelems]
+            _dtype = out.dtype
+        view = memoryview(out).cast('B')
         pos = 0
         while len(view):
-            nrx = self.sock.recv_into(view)
+            # short read on signal or EOF: loop again, 0 is end of file
+            nrx = self.sock.recv_into(view, len(view), self.recv_flags)
             if nrx == 0:
                 break               # end of file
             view = view[nrx:]
             pos += nrx
 
-        if pos > 0 and pos < nelems:
-            print("WARNING: early termination at {}/{}".format(pos, nelems))
-        return np.frombuffer(buf[:pos], _dtype)
+        if pos > 0 and pos < out.nbytes:
+            print("WARNING: early termination at {}/{}".format(pos//data_size, nelems))
+        return out[:pos//_dtype.itemsize]
+
+    def get_blocks(self, nelems, data_size=2, out=None):
+        """yield blocks of nelems until end of file
+
+        Args:
+            nelems (int): data elements per block
+            data_size (int, optional): data size in bytes 2|4 short or int. Defaults to 2.
+            out (ndarray, optional): reusable receive buffer. Each block is a view of out, \
+            valid only until the next block is read. Defaults to None (new array per block).
 
-    def get_blocks(self, nelems, data_size=2):
-        block = np.array([1])
-        while len(block) > 0:
-            block = self.read(nelems, data_size=data_size)
-            if len(block) > 0:
-                yield block
+        Yields:
+            ndarray: data block
+        """
+        while True:
+            block = self.read(nelems, data_size=data_size, out=out)
+            if block.size == 0:
+                return
+            yield block
 
 
 class MgtDramPullClient(RawClient):
@@ -186,10 +255,18 @@ class MgtDramPullClient(RawClient):
         RawClient.__init__(self, addr, AcqPorts.MGTDRAM_PULL_DATA)
 
 
+class StreamClient(RawClient):
+    """continuous stream, sustained high rate: receive buffer may be tuned apart from one-shot uploads"""
+    rcvbuf = int(os.getenv("ACQ400_STREAM_RCVBUF", 0))      # 0: autotuned, see RawClient
+
+
 
 class ChannelClient(RawClient):
     """handles post shot data for one channel.
 
+    read() is inherited from RawClient: data is received directly into the
+    returned ndarray.
+
     Args:
         addr (str) : ip address or hostname
 
@@ -208,88 +285,199 @@ class ExitCommand(Exception):
 def signal_handler(signal, frame):
     raise ExitCommand()
 
+def _run_bounded(fn, items, timeout=10.0, max_workers=8):
+    """run fn(item) for all items in parallel, wait no longer than timeout.
+
+    A late call is not fatal: it carries on in the background. A failed call is reported, not raised.
+
+    Returns:
+        list: results of the calls that completed in time, in item order
+    """
+    ex = ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(items))))
+    futs = [ex.submit(fn, item) for item in items]
+    wait(futs, timeout=timeout)
+    ex.shutdown(wait=False)
+    results = []
+    for item, fut in zip(items, futs):
+        if not fut.done():
+            print("WARNING: {} {} not complete after {}s, continuing".format(fn.__name__, item, timeout))
+        elif fut.exception() is not None:
+            print("WARNING: {} {} failed {}".format(fn.__name__, item, fut.exception()))
+        else:
+            results.append(fut.result())
+    return results
+
+class _StatusPoller:
+    """ services the status channel of every Statusmonitor from one thread
+
+    One selector over all status sockets: O(1) threads for O(N) uuts.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def _after_fork_in_child(cls):
+        # the poll thread does not survive fork: the child starts its own on first use.
+        # The parent's selector is left alone, an epoll set is shared with the parent.
+        cls._instance = None
+        cls._instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.sel = selectors.DefaultSelector()
+        self.lock = threading.Lock()
+        # wake the poll thread so (un)registrations take effect on every selector type
+        self.wake_rx, self.wake_tx = socket.socketpair()
+        self.wake_rx.setblocking(False)
+        self.sel.register(self.wake_rx, selectors.EVENT_READ, None)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def register(self, statmon):
+        with self.lock:
+            self.sel.register(statmon.logclient.sock, selectors.EVENT_READ, statmon)
+        self.wake_tx.send(b'\0')
+
+    def unregister(self, statmon):
+        with self.lock:
+            try:
+                self.sel.unregister(statmon.logclient.sock)
+            except (KeyError, ValueError):
+                pass
+        self.wake_tx.send(b'\0')
+
+    def service(self, statmon):
+        try:
+            lines = statmon.logclient.poll_lines()
+        except OSError as err:
+            if not statmon.quit_requested:
+                print("%s status poll failed %s" % (repr(statmon), err))
+            lines = None
+        if lines is None:
+            self.unregister(statmon)
+            return
+        for st in lines:
+            try:
+                statmon.st_handle(st)
+            except Exception as err:
+                # one bad uut must not stop the thread shared by all the others
+                print("%s status handler failed %s" % (repr(statmon), err))
+                statmon.quit_requested = True
+            if statmon.quit_requested:
+                self.unregister(statmon)
+                return
+
+    def drop_bad_keys(self):
+        """unregister sockets that can no longer be polled (eg closed while a select was in flight)"""
+        with self.lock:
+            keys = [key for key in self.sel.get_map().values() if key.data is not None]
+        for key in keys:
+            try:
+                select.select([key.fileobj], [], [], 0)
+            except (OSError, ValueError):
+                print("%s status channel lost" % repr(key.data))
+                self.unregister(key.data)
+
+    def run(self):
+        # one thread for every uut in the process: an error here must not end monitoring for all
+        while True:
+            try:
+                for key, mask in self.sel.select():
+                    if key.data is None:
+                        try:
+                            self.wake_rx.recv(4096)
+                        except BlockingIOError:
+                            pass
+                    else:
+                        self.service(key.data)
+            except (OSError, ValueError) as err:
+                print("_StatusPoller: %s, dropping bad status channels" % err)
+                self.drop_bad_keys()
+                time.sleep(0.1)         # no busy loop should the error persist
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_StatusPoller._after_fork_in_child)
+
+
 class Statusmonitor:
     """ monitors the status channel
 
-    Efficient event-driven monitoring in a separate thread
+    Efficient event-driven monitoring, one shared thread for all uuts
     """
-    st_re = re.compile(r"([0-9]) ([0-9]+) ([0-9]+) ([0-9]+) ([0-9])+" )
     st_shot_re = re.compile(r"SHOT=([0-9]),([0-9]+),([0-9]+),([0-9]+)")
     st_failed_to_find_event_re = re.compile(r"ERROR EVENT NOT FOUND")
     st_timer_re = re.compile(r"Timer::report\(([0-9]+)\) ([A-Z]{3}) ([0-9]+) msec")
 
     def __repr__(self):
         return repr(self.logclient)
-    
-    def st_monitor(self):
-        self.data_valid = "UNKNOWN"
 
-        while self.quit_requested == False:
-            try:
-                st = self.logclient.poll()
-            except OSError as err:
-                if self.quit_requested:
-                    return
-                else:
-                    raise err
+    def st_handle(self, st):
+        """process one status line, called from the _StatusPoller thread"""
+        if self.trace > 1:
+            print("%s <%s>" % (repr(self), st))
+
+        match = self.st_failed_to_find_event_re.search(st)
+        if match:
+            self.data_valid = "ERROR EVENT NOT FOUND"
+
+        match = self.st_timer_re.search(st)
+        if match:
+            print("TIMER: {} {} {} ms".format(match.group(2), match.group(1), match.group(3)))
+            if match.group(2) == "ROI":
+                self.search_roi_count += 1
+            elif match.group(2) == "ALL":
+                self.search_all_count += 1
+            else:
+                print("ERROR bad match {}".format(match.group(1)))
+
+        match = self.st_shot_re.search(st)
+        if match:
+            status1 = [int(x) for x in match.groups()]
+            if status1[0] == 1:
+                self.data_valid = "ARM"
+            elif status1[0] == 0:
+                if self.data_valid == "ARM" and status1[1] > 0 and status1[1] == status1[3]:
+                    self.data_valid = "DATA_VALID"
+            return
 
+        # status line is 5 space separated integers: STATE PRE POST ELAPSED DEMUX
+        parts = st.split()
+        if len(parts) >= 5 and parts[0].isdigit():
+            try:
+                status1 = list(map(int, parts[:5]))
+            except ValueError:
+                return
             if self.trace > 1:
-                print("%s <%s>" % (repr(self), st))
-
-
-            match = self.st_failed_to_find_event_re.search(st)
-            if match:
-                self.data_valid = "ERROR EVENT NOT FOUND"
-
-            match = self.st_timer_re.search(st)
-            if match:
-                print("TIMER: {} {} {} ms".format(match.group(2), match.group(1), match.group(3)))
-                if match.group(2) == "ROI":
-                    self.search_roi_count += 1
-                elif match.group(2) == "ALL":
-                    self.search_all_count += 1
-                else:
-                    print("ERROR bad match {}".format(match.group(1)))
-
-            match = self.st_shot_re.search(st)
-            if match:
-                status1 = [int(x) for x in match.groups()]
-                if status1[0] == 1:
-                    self.data_valid = "ARM"
-                elif status1[0] == 0:
-                    if self.data_valid == "ARM" and status1[1] > 0 and status1[1] == status1[3]:
-                        self.data_valid = "DATA_VALID"
-                continue
-
-            match = self.st_re.search(st)
-            # status is a match. need to look at group(0). It's NOT a LIST!
-            if match:
-                statuss = match.groups()
-                status1 = [int(x) for x in statuss]
-                if self.trace > 1:
-                    print("%s <%s" % (repr(self), status1))
-                if self.status != None:
-                    if self.status[SF.STATE] != status1[SF.STATE]:
-                        self.state_changed.set()
+                print("%s <%s" % (repr(self), status1))
+            if self.status != None:
+                if self.status[SF.STATE] != status1[SF.STATE]:
+                    self.shot_meta.clear()
+                    self._notify(self.state_changed)
 #                    print("Status check %s %s" % (self.status0[0], status[0]))
-                    if self.status[SF.STATE] != 0 and status1[SF.STATE] == 0:
-                        if self.trace:
-                            print("%s STOPPED!" % (self.uut))
-                        self.stopped.set()
-                        self.armed.clear()
+                if self.status[SF.STATE] != 0 and status1[SF.STATE] == 0:
+                    if self.trace:
+                        print("%s STOPPED!" % (self.uut))
+                    self._notify(self.stopped)
+                    self.armed.clear()
 #                print("status[0] is %d" % (status[0]))
-                    if status1[SF.STATE] == 1:
-                        if self.trace:
-                            print("%s ARMED!" % (self.uut))
-                        self.armed.set()
-                        self.stopped.clear()
-                    if self.status[SF.STATE] == 0 and status1[SF.STATE] > 1:
-                        if self.trace:
-                            print("ERROR: %s skipped ARM %d -> %d" % (self.uut, self.status[0], status1[0]))
-                        self.quit_requested = True
-                        os.kill(self.main_pid, signal.SIGINT)
-                        sys.exit(1)
-                self.status = status1
+                if status1[SF.STATE] == 1:
+                    if self.trace:
+                        print("%s ARMED!" % (self.uut))
+                    self._notify(self.armed)
+                    self.stopped.clear()
+                if self.status[SF.STATE] == 0 and status1[SF.STATE] > 1:
+                    if self.trace:
+                        print("ERROR: %s skipped ARM %d -> %d" % (self.uut, self.status[0], status1[0]))
+                    self.quit_requested = True
+                    os.kill(self.main_pid, signal.SIGINT)
+                    return
+            self.status = status1
 
 
     def get_state(self):
@@ -308,12 +496,42 @@ class Statusmonitor:
         return self.status[SF.ELAPSED]
 
 
+    def _notify(self, ev=None):
+        """set ev (if any) and wake all wait_event() callers"""
+        with self._cv:
+            if ev is not None:
+                ev.set()
+            self._cv.notify_all()
+
+    @property
+    def break_requested(self):
+        return self._break_requested
+
+    @break_requested.setter
+    def break_requested(self, value):
+        self._break_requested = value
+        self._notify()
+
+    @property
+    def quit_requested(self):
+        return self._quit_requested
+
+    @quit_requested.setter
+    def quit_requested(self, value):
+        self._quit_requested = value
+        self._notify()
+
     def wait_event(self, ev, descr=""):
     #       print("wait_%s 02 %d" % (descr, ev.is_set()))
-        while ev.wait(0.1) == False and not self.break_requested:
-            if self.quit_requested:
-                print("QUIT REQUEST call exit %s" % (descr))
-                sys.exit(1)
+        # sleeps until notified. The 1s timeout only keeps Ctrl-C working: an untimed wait is not
+        # interruptible on Windows
+        done = lambda: ev.is_set() or self.break_requested or self.quit_requested
+        with self._cv:
+            while not self._cv.wait_for(done, timeout=1.0):
+                pass
+        if not ev.is_set() and not self.break_requested:
+            print("QUIT REQUEST call exit %s" % (descr))
+            sys.exit(1)
 
 #        print("wait_%s 88 %d" % (descr, ev.is_set()))
         ev.clear()
@@ -336,6 +554,7 @@ class Statusmonitor:
 
 
     def __init__(self, _uut, _status):
+        self._cv = threading.Condition()
         self.break_requested = False
         self.quit_requested = False
         self.trace = Statusmonitor.trace
@@ -345,13 +564,18 @@ class Statusmonitor:
         self.stopped = threading.Event()
         self.armed = threading.Event()
         self.state_changed = threading.Event()
-        self.logclient = netclient.Logclient(_uut, AcqPorts.TSTAT)
-        self.st_thread = threading.Thread(target=self.st_monitor)
-        self.st_thread.setDaemon(True)
-        self.st_thread.start()
         self.data_valid = "UNKNOWN"
         self.search_roi_count = 0
         self.search_all_count = 0
+        self.shot_meta = {}          # knobs constant for a shot, cleared on state change
+        self.logclient = netclient.Logclient(_uut, AcqPorts.TSTAT)
+        _StatusPoller.instance().register(self)
+
+    def close(self):
+        """stop monitoring and close the status channel"""
+        self.quit_requested = True
+        _StatusPoller.instance().unregister(self)
+        self.logclient.close()
 
 
 class NullFilter:
@@ -362,6 +586,7 @@ null_filter = NullFilter()
 
 class ProcessMonitor:
     st_rex = ( re.compile(r"^END" ), re.compile(r"^real"), re.compile(r"^finished"))
+    termex = re.compile("(\n)")
 
     def st_monitor(self):
         while self.quit_requested == False:
@@ -384,13 +609,60 @@ class ProcessMonitor:
         self.quit_requested = False
         self.output_filter = _filter
         self.logclient = netclient.Logclient(_uut.uut, _monport)
-        self.logclient.termex = re.compile("(\n)")
+        self.logclient.termex = ProcessMonitor.termex
         self.st_thread = threading.Thread(target=self.st_monitor)
         self.st_thread.setDaemon(True)
         self.st_thread.start()
         if set_arm:
             _uut.s0.BLT_SET_ARM = '1'
 
+def _mux_view(mux, nchan):
+    """[chan, sample] view of a muxed buffer, no copy.
+
+    Rows alias mux: treat them as read-only, writes land in the muxed buffer.
+    A trailing partial sample is not included.
+
+    Args:
+        mux (ndarray): 1-D muxed data
+        nchan (int): channels per sample
+    """
+    mux = np.asarray(mux)
+    step = mux.strides[0]          # itemsize for a contiguous buffer
+    nsamples = len(mux)//nchan
+    return np.lib.stride_tricks.as_strided(mux, shape=(nchan, nsamples), strides=(step, nchan*step))
+
+_HEX_DIGITS = np.frombuffer(b"0123456789ABCDEF", np.uint8)
+
+def _hex_dump(rows, ngroups):
+    """formats event rows as text, one column per group, "0xXXXXXXXX " tokens.
+
+    Fills a single preallocated bytearray with vector ops, no per token strings.
+
+    Args:
+        rows (ndarray): [event, chan] uint32
+        ngroups (int): columns, chan is split into ngroups equal runs
+
+    Returns:
+        str: per event, one line per position in the run, then a blank line
+    """
+    nev, nchan = rows.shape
+    ll = nchan//ngroups
+    width = ngroups*11 + 1                          # tokens + newline
+    buf = bytearray(nev*(ll*width + 1))
+    text = np.frombuffer(buf, np.uint8).reshape(nev, ll*width + 1)
+    text[:, -1] = ord("\n")
+    lines = text[:, :-1].reshape(nev, ll, width)
+    lines[:, :, -1] = ord("\n")
+    tokens = lines[:, :, :-1].reshape(nev, ll, ngroups, 11)
+    # line i holds element i of every group
+    values = rows.astype(np.uint32, copy=False).reshape(nev, ngroups, ll).transpose(0, 2, 1)
+    tokens[..., 0] = ord("0")
+    tokens[..., 1] = ord("x")
+    for k in range(8):
+        tokens[..., 2 + k] = _HEX_DIGITS[(values >> (28 - 4*k)) & 0xF]
+    tokens[..., 10] = ord(" ")
+    return buf.decode("ascii")
+
 class Acq400:
     """Host-side proxy for Acq400 uut.
 
@@ -415,20 +687,9 @@ class Acq400:
         *** Experimental Do Not Use ***
 
         """
-        uuts = []
-        uut_threads = {}
-        for uname in uut_names:
-            uut_threads[uname] = \
-                    threading.Thread(\
-                        target=lambda u, l: l.append(cls(u)), \
-                        args=(uname, uuts))
-        for uname in uut_names:
-            uut_threads[uname].start()
-        for t in uut_threads:
-            uut_threads[t].join(10.0)
-
-        return uuts
+        return _run_bounded(cls, uut_names)
 
+    NL = re.compile(r"(\n)")
     uuts_methods = {}        # for cloning by new
     uuts = {}                # for re-use by factory
 
@@ -448,7 +709,6 @@ class Acq400:
             pass
 
         self.verbose = int(os.getenv("ACQ400_VERBOSE", "0"))
-        self.NL = re.compile(r"(\n)")
         self.uut = _uut
         self.trace = 0
         self.save_data = None
@@ -458,27 +718,20 @@ class Acq400:
         # channel index from 1,..
         self.cal_eslo = [0, ]
         self.cal_eoff = [0, ]
+        self._rshift = {}        # scale_raw shift, keyed by volts
+        self._site_types_cache = None    # module fit is fixed at boot, see invalidate_site_cache()
+        self._ai_channels_cache = None
         self.mb_clk_min = 4000000
 
         s0 = self.svc["s0"] = s0_client if s0_client else netclient.Siteclient(self.uut, AcqPorts.SITE0)
         sl = s0.SITELIST.split(",")
         sl.pop(0)
         self.awg_site = 0
-        site_enumerators = {}
-        for sm in sl:
-            site_enumerators[sm] = \
-                    threading.Thread(target=self.init_site_client,\
-                        args=(int(sm.split("=").pop(0)),)\
-                    )
-        for sm in sl:
-            site_enumerators[sm].start()
-
-        for sm in sl:
-#            print("join {}".format(site_enumerators[sm]))
-            site_enumerators[sm].join(10.0)
-
         self.sites = [int(s.split('=')[0]) for s in sl]
 
+        # as before: a slow or failed site does not hold up or fail construction
+        _run_bounded(self.init_site_client, self.sites)
+
         if monitor:
             # init _status so that values are valid even if this Acq400 doesn't run a shot ..
             try: _status = [int(x) for x in s0.state.replace('STX ', '').split(" ")]
@@ -516,10 +769,8 @@ class Acq400:
 
     def close(self):
         """Closes uut connection gracefully"""
-        self.statmon.quit_reqested = True
-
         try:
-            self.statmon.logclient.close()
+            self.statmon.close()
         except Exception as e:
             print(f"error closing statmon log client {e}")
 
@@ -574,15 +825,38 @@ class Acq400:
 
     def fetch_all_calibration(self):
         """Gets uut calibration and stores in instance"""
+        # channel index from 1: element 0 is a placeholder
+        eslo = [np.zeros(1)]
+        eoff = [np.zeros(1)]
         try:
-            for m in self.get_aggregator_svc_list(self):
-                self.cal_eslo.extend(m.AI_CAL_ESLO.split(' ')[3:])
-                self.cal_eoff.extend(m.AI_CAL_EOFF.split(' ')[3:])
+            for m in self.get_aggregator_svc_list():
+                # parse each knob once, straight to float64
+                eslo.append(np.array(m.AI_CAL_ESLO.split(' ')[3:], dtype=np.float64))
+                eoff.append(np.array(m.AI_CAL_EOFF.split(' ')[3:], dtype=np.float64))
         except:
-            pass
+            return
+        self.cal_eslo = np.concatenate(eslo)
+        self.cal_eoff = np.concatenate(eoff)
+
+    def scale_raw(self, raw, volts=False, out=None):
+        """right justify raw data
+
+        Args:
+            raw (ndarray): raw data
+            volts (bool, optional): scale for chan2volts. Defaults to False.
+            out (ndarray, optional): output array, pass raw to scale in place. Defaults to None (new array).
+
+        Returns:
+            ndarray: scaled data
+        """
+        return np.right_shift(raw, self._get_rshift(volts), out=out)
 
-    def scale_raw(self, raw, volts=False):
-        for (sx, m) in list(self.modules.items()):
+    def _get_rshift(self, volts):
+        try:
+            return self._rshift[volts]
+        except KeyError:
+            # module properties are fixed for the life of the uut: query once
+            m = next(iter(self.modules.values()))
             if m.MODEL.startswith("ACQ43"):
                 rshift = 8
             elif m.data32 == '1':
@@ -593,8 +867,8 @@ class Acq400:
                     rshift = 16 - (8 if volts else 0)
             else:
                 rshift = 0
-            break
-        return np.right_shift(raw, rshift)
+            self._rshift[volts] = rshift
+            return rshift
 
     def chan2volts(self, chan, raw):
         """returns calibrated volts for channel
@@ -609,13 +883,57 @@ class Acq400:
         if len(self.cal_eslo) == 1:
             self.fetch_all_calibration()
 
-        eslo = float(self.cal_eslo[chan])
-        eoff = float(self.cal_eoff[chan])
+        eslo = self.cal_eslo[chan]
+        eoff = self.cal_eoff[chan]
 
         if self.verbose > 1 or (self.verbose and chan < 4):
             print("chan {} v = {}*{} + {}".format(chan, raw[0], eslo, eoff))
 
-        return np.add(np.multiply(raw, eslo), eoff)
+        # one output array, scaled in place: no temporary for the product
+        raw = np.asarray(raw)
+        volts = np.empty(raw.shape, np.float64)
+        nb = _numba() if raw.ndim == 1 else False
+        if nb:
+            nb.volts(raw, eslo, eoff, volts)
+        else:
+            np.multiply(raw, eslo, out=volts)
+            np.add(volts, eoff, out=volts)
+        return volts if volts.ndim else volts[()]
+
+    def scale_volts(self, raw, nchan=None):
+        """returns calibrated volts for muxed raw data in one pass
+
+        Equivalent to scale_raw(raw, volts=True) then chan2volts() on each channel,
+        fused into a single parallel kernel when numba is installed.
+
+        Args:
+            raw (ndarray): muxed raw data, order [sample][channel], channel 1 first
+            nchan (int, optional): channels per sample, all calibrated. Defaults to nchan().
+
+        Returns:
+            ndarray: calibrated data, shape (nsamples, nchan)
+        """
+        nchan = nchan if nchan else self.nchan()
+        if len(self.cal_eslo) == 1:
+            self.fetch_all_calibration()
+        eslo = np.asarray(self.cal_eslo[1:nchan+1], dtype=np.float64)
+        eoff = np.asarray(self.cal_eoff[1:nchan+1], dtype=np.float64)
+        if len(eslo) != nchan:
+            raise ValueError("calibration available for {} channels, need {}".format(len(eslo), nchan))
+
+        rshift = self._get_rshift(True)
+        raw = np.ascontiguousarray(raw).reshape(-1)
+        raw = raw[:len(raw)//nchan*nchan]
+        volts = np.empty(len(raw), np.float64)
+        nb = _numba()
+        if nb:
+            nb.scale_volts(raw, rshift, eslo, eoff, volts)
+            return volts.reshape(-1, nchan)
+        volts = volts.reshape(-1, nchan)
+        np.right_shift(raw.reshape(-1, nchan), rshift, out=volts, casting='unsafe')
+        np.multiply(volts, eslo, out=volts)
+        np.add(volts, eoff, out=volts)
+        return volts
 
 
     def read_chan(self, chan, nsam = 0, data_size = None):
@@ -629,28 +947,45 @@ class Acq400:
         Returns:
             ndarray
         """
+        ccraw, store = self._fetch_chan(chan, nsam, data_size)
+        if store:
+            store()
+        return ccraw
+
+    def _fetch_chan(self, chan, nsam = 0, data_size = None):
+        """read_chan() network part: the save_data write is returned for the caller to schedule.
+
+        Returns:
+            (ndarray, callable): channel data, function to complete the save_data write or None
+        """
         if data_size == None:
-            data_size = 4 if self.s0.data32 == '1' else 2
+            data_size = 4 if self.shot_knob("s0", "data32") == '1' else 2
 
         if chan == 0:
-            nsam = int(self.s0.raw_data_size) // data_size
+            nsam = int(self.shot_knob("s0", "raw_data_size")) // data_size
         if chan != 0 and nsam == 0:
             nsam = self.pre_samples()+self.post_samples()
 
-        cc = ChannelClient(self.uut, chan)
-        ccraw = cc.read(nsam, data_size=data_size)
-        cc.close()
+        fn = None
         if self.save_data:
             try:
                 os.makedirs(self.save_data)
             except OSError as exception:
                 if exception.errno != errno.EEXIST:
                     raise
+            fn = "%s/%s_CH%02d" % (self.save_data, self.uut, chan)
 
-            with open("%s/%s_CH%02d" % (self.save_data, self.uut, chan), 'wb') as fid:
-                ccraw.tofile(fid, '')
+        store = None
+        cc = ChannelClient(self.uut, chan)
+        ccraw = cc.read(nsam, data_size=data_size)
+        cc.close()
+        if fn:
+            # the caller owns ccraw, the file is a separate copy written to the page cache
+            def store():
+                with open(fn, 'wb') as fid:
+                    ccraw.tofile(fid, '')
 
-        return ccraw
+        return ccraw, store
 
     def read_decims(self, nsam = 0):
         if nsam == 0:
@@ -774,17 +1109,16 @@ class Acq400:
                         (self.uut, ch, tt, len(chx[-1])*2/1000000/tt))
         else:
             # only do local demux if client wants it and the data needs it..
-            data = np.array(self.read_chan(0, nsam, data_size=data_size))
+            data = self.read_chan(0, nsam, data_size=data_size)
             data = data.reshape((-1, self.nchan()))
             if bulk_channels:
  #               print("read_channels() local demux, bulk data")
-                channels = np.arange(0, self.nchan())
+                # all channels: rows of the transposed view, no gather
+                chx = list(data.T)
             else:
  #               print("read_channels() local demux, selected channels")
-                channels = np.array(channels)-1
-
-            data = data[:,channels].transpose()
-            chx = [ item for item in data ]
+                # copy each selected column once, contiguous for downstream use
+                chx = [ np.ascontiguousarray(data[:, ch-1]) for ch in channels ]
 
         return chx
     
@@ -808,10 +1142,11 @@ class Acq400:
         want_raw = True if channels == (0,) else False # 0 means all channels no demux "raw"
         want_all_cooked = len(channels) == 0
         
-        data_size = 4 if int(self.s0.data32) else 2
-        raw_data_size = int(self.s0.raw_data_size)
-        ch_data_size = int(self.s1.ch_data_size)
-        nchan = int(self.s0.NCHAN)
+        # one query per knob per shot: read_chan() below is given data_size, nsam explicitly
+        data_size = 4 if int(self.shot_knob("s0", "data32")) else 2
+        raw_data_size = int(self.shot_knob("s0", "raw_data_size"))
+        ch_data_size = int(self.shot_knob("s1", "ch_data_size"))
+        nchan = int(self.shot_knob("s0", "NCHAN"))
         is_cooked = raw_data_size < 1 # raw_data_size is 0 when data has been demuxed ("cooked") on uut
         
         if is_cooked: #if data has been demuxed on uut
@@ -819,16 +1154,26 @@ class Acq400:
             if is_cooked and want_raw:
                 print('data is_cooked but we want_raw : consider running shots with DEMUX=0 to save effort')
 
-            data = []
             nsam = nsam if nsam else ch_data_size // data_size
-            nspad = int(self.s0.spad.split(',')[1])
+            nspad = int(self.shot_knob("s0", "spad").split(',')[1])
             nspad_chan = nspad if data_size==4 else nspad*2
             ndata_chan = nchan - nspad_chan
             if want_all_cooked or want_raw:
                 channels = [ch for ch in range(1, ndata_chan+1)]
 
-            for chan in channels:
-                data.append(self.read_chan(chan, nsam, data_size))
+            # one socket per channel: overlap the transfers, results in channel order.
+            # save_data writes run on their own thread as each channel arrives, so disk
+            # does not hold up the network.
+            data = []
+            stores = []
+            with ThreadPoolExecutor(max_workers=min(32, max(1, len(channels)))) as net_pool, \
+                 ThreadPoolExecutor(max_workers=1) as disk_pool:
+                for ccraw, store in net_pool.map(lambda chan: self._fetch_chan(chan, nsam, data_size), channels):
+                    data.append(ccraw)
+                    if store:
+                        stores.append(disk_pool.submit(store))
+                for st in stores:
+                    st.result()
                 
             if want_raw:
                 return np.array(data, order='F').T.reshape(1, -1) #return muxed data
@@ -841,11 +1186,12 @@ class Acq400:
             if want_raw:
                 return np.array([data]) #return all channels no demux
             else:
-                data = data.reshape(-1, nchan).transpose() #demux channels
-                if len(channels) > 0:
-                    return data[np.array(channels) - 1] #return specified channels
+                data = data.reshape(-1, nchan).transpose() #demux channels: a view, no copy
+                if len(channels) > 0 and list(channels) != list(range(1, nchan+1)):
+                    # one gather, each selected channel lands in a contiguous row
+                    return np.ascontiguousarray(data[np.array(channels) - 1]) #return specified channels
                 else:
-                    return data #return all channels
+                    return data #return all channels, still a view of the muxed buffer
         
     read_channels = _read_channels_2
 
@@ -877,6 +1223,27 @@ class Acq400:
     def clear_counters(self):
         for s in self.svc:
             self.svc[s].sr('*RESET=1')
+        if 'statmon' in self.__dict__:
+            self.statmon.shot_meta.clear()
+
+    def shot_knob(self, site, knob):
+        """returns knob value, cached until the next state change
+
+        Use for knobs that are constant for the duration of a shot (eg data32, NCHAN).
+        Without a statmon, nothing invalidates a cache, so the uut is queried every time.
+
+        Args:
+            site (str): site service eg "s0"
+            knob (str): knob name
+        """
+        statmon = self.__dict__.get('statmon')
+        if statmon is None:
+            return getattr(self.svc[site], knob)
+        try:
+            return statmon.shot_meta[(site, knob)]
+        except KeyError:
+            value = statmon.shot_meta[(site, knob)] = getattr(self.svc[site], knob)
+            return value
 
     def set_sync_routing_master(self, clk_dx="d1", trg_dx="d0"):
         self.s0.SIG_SYNC_OUT_CLK = "CLK"
@@ -934,9 +1301,9 @@ class Acq400:
             wait_eof (bool, optional): wait for end of file. Defaults to True.
             wait_eol (bool, optional): wait for end of line. Defaults to True.
         """
-        termex = re.compile("\n")
         with netclient.Netclient(self.uut, port) as nc:
             lines = stl.split("\n")
+            payload = []
             for ll in lines:
                 if trace:
                     print("> {}".format(ll))
@@ -948,12 +1315,16 @@ class Acq400:
                     if trace:
                         print("skip comment")
                     continue
-                nc.sock.send((ll+"\n").encode())
                 if wait_eol:
+                    nc.sock.sendall((ll+"\n").encode())
                     rx = nc.sock.recv(4096)
                     if trace:
                         print("< {}".format(rx))
-            nc.sock.send("EOF\n".encode())
+                else:
+                    payload.append(ll)
+            # no per line reply: send the whole file in one go, not one round trip per line
+            payload.append("EOF\n")
+            nc.sock.sendall("\n".join(payload).encode())
             nc.sock.shutdown(socket.SHUT_WR)
             while wait_eof:
                 rx = nc.sock.recv(4096)
@@ -1003,7 +1374,7 @@ class Acq400:
         """Load and config a AWG pattern
 
         Args:
-            data (str): AWG pattern
+            data (bytes, ndarray or binary file): AWG pattern. A file is sent with sendfile() where the OS supports it.
             autorearm (bool, optional): Rearm and wait after run. Defaults to False.
             continuous (bool, optional): Run pattern continuously. Defaults to False.
             repeats (int, optional): Number of pattern repetitions. Defaults to 1.
@@ -1023,9 +1394,17 @@ class Acq400:
                 AcqPorts.AWG_AUTOREARM if autorearm else AcqPorts.AWG_ONCE
 
         with netclient.Netclient(self.uut, port) as nc:
-            while repeats:
-                nc.sock.send(data)
-                repeats -= 1
+            if hasattr(data, 'read'):
+                # file: in kernel copy, no pass through user space
+                offset = data.tell()
+                for rep in range(repeats):
+                    data.seek(offset)
+                    nc.sock.sendfile(data)
+            else:
+                # sendall: send() may be short, silently dropping the tail
+                view = memoryview(data).cast('B')
+                for rep in range(repeats):
+                    nc.sock.sendall(view)
             nc.sock.shutdown(socket.SHUT_WR)
             while True:
                 rx = nc.sock.recv(128)
@@ -1297,9 +1676,9 @@ class Acq400:
             nchan = self.nchan()
             if channels == ():
                 channels = list(range(1,nchan+1))
-            for ch in channels:
-                print("Channel - ", ch)
-                data.append(mux_data[ch-1::nchan])
+            print("Channels - ", channels)
+            chans = _mux_view(mux_data, nchan)
+            data = [chans[ch-1] for ch in channels]
 
         import matplotlib.pyplot as plt
         for channel in data:
@@ -1331,10 +1710,7 @@ class Acq400:
         if demux_state == 1:
             data = self.read_channels(channels, -1)
         elif demux_state == 0:
-            data = []
-            mux_data = self.read_muxed_data()
-            for ch in channels:
-                data.append(mux_data[ch-1::nchan])
+            data = list(_mux_view(self.read_muxed_data(), nchan))
         return data
 
 
@@ -1346,27 +1722,40 @@ class Acq400:
         Returns:
             int: total AI channels
         """
+        if self._ai_channels_cache is not None:
+            return self._ai_channels_cache
         ai_channels = 0
         site_types = self.get_site_types()
         for ai_site in site_types["AISITES"]:
             ai_site = "s{}".format(ai_site)
             ai_channels += int(getattr(getattr(self, ai_site), "NCHAN"))
 
+        self._ai_channels_cache = ai_channels
         return ai_channels
 
+    def invalidate_site_cache(self):
+        """forget cached get_site_types() and get_ai_channels() results, next call probes the uut"""
+        self._site_types_cache = None
+        self._ai_channels_cache = None
+
     def get_site_types(self):
         """gets all sites grouped by site type
 
         Returns:
             dict: AISITES, AOSITES, and DIOSITES
         """
+        if self._site_types_cache is not None:
+            return {key: list(sites) for key, sites in self._site_types_cache.items()}
         AISITES = []
         AOSITES = []
         DIOSITES = []
 
         for site in [1,2,3,4,5,6]:
+            svc = self.svc.get('s{}'.format(site))
+            if svc is None:
+                continue
             try:
-                module_name = eval('self.s{}.module_name'.format(site))
+                module_name = svc.module_name
                 if module_name.startswith('acq'):
                     AISITES.append(site)
                 elif module_name.startswith('ao'):
@@ -1377,7 +1766,8 @@ class Acq400:
                 continue
 
         site_types = { "AISITES": AISITES, "AOSITES": AOSITES, "DIOSITES": DIOSITES }
-        return site_types
+        self._site_types_cache = site_types
+        return {key: list(sites) for key, sites in site_types.items()}
 
     def get_es_indices(self, file_path="default", nchan="default", human_readable=0, return_hex_string=0):
         """Returns the location of event samples.
@@ -1390,84 +1780,118 @@ class Acq400:
             the event samples. Defaults to 0.
 
         Returns:
-            list: [ [Event sample indices], [Event sample data] ]
+            list: [ ndarray Event sample indices, ndarray Event sample data (or hex string) ]
         """
-        indices = []
-        event_samples = []
-        nchan = self.nchan() if nchan == "default" else nchan
+        # uut queries up front, once per call
+        nchan = int(self.nchan() if nchan == "default" else nchan)
+        data32 = int(self.shot_knob("s0", "data32"))
+        if data32 == 0:
+            nchan //= 2 # "effective" nchan has halved if data is shorts.
 
         if file_path == "default":
-            data = self.read_muxed_data()
-            data = np.array(data)
+            data = np.asarray(self.read_muxed_data())
             if data.dtype == np.int16:
-                # convert shorts back to raw bytes and then to longs.
-                data = np.frombuffer(data.tobytes(), dtype=np.uint32)
+                # reinterpret shorts as longs in place: no copy. Needs an even count.
+                data = np.ascontiguousarray(data[:len(data) & ~1]).view(np.uint32)
+        elif os.path.getsize(file_path) >= 4:
+            # page in on demand, only the marker rows are copied out
+            data = np.memmap(file_path, dtype=np.uint32, mode='r', shape=(os.path.getsize(file_path)//4,))
         else:
-            data = np.fromfile(file_path, dtype=np.uint32)
-
-        if int(self.s0.data32) == 0:
-            nchan = nchan / 2 # "effective" nchan has halved if data is shorts.
-        nchan = int(nchan)
-        for index, sample in enumerate(data[0::nchan]):
-            # if sample == np.int32(0xaa55f154): # aa55
-            if sample == np.uint32(0xaa55f154): # aa55
-                indices.append(index)
-                event_samples.append(data[index*nchan:index*nchan + nchan])
+            data = np.fromfile(file_path, dtype=np.uint32)      # memmap refuses an empty file
+
+        # compare bit patterns: int32 data (data32) against a uint32 marker would promote to int64 and never match
+        strided = np.ascontiguousarray(data[:(len(data)//nchan)*nchan]).view(np.uint32).reshape(-1, nchan)
+        nb = _numba()
+        if nb:
+            # compiled scan, no temporary mask
+            es_rows = nb.find_es(strided.reshape(-1), nchan)
+        else:
+            # one vector compare over the first column of every sample, no per sample python
+            es_rows = np.flatnonzero(strided[:,0] == np.uint32(0xaa55f154)) # aa55
+        # packed arrays, not lists of python ints
+        indices = es_rows.astype(np.int32) if len(strided) < 2**31 else es_rows
+        event_samples = strided[es_rows]
 
         if human_readable == 1:
-            # Change decimal to hex.
-            ii = 0
-            while ii < len(event_samples):
-                if type(event_samples[ii]) == np.ndarray:
-                    event_samples[ii] = event_samples[ii].tolist()
-                for indice, channel in enumerate(event_samples[ii]):
-                    event_samples[ii][indice] = '0x{0:08X}'.format(channel)
-                ll = int(len(event_samples[ii])/int(len(self.get_aggregator_sites())))
-                # print(event_samples[ii])
-                event_samples[ii] = [event_samples[ii][i:i + ll] for i in range(0, len(event_samples[ii]), ll)]
-                ii += 1
+            # Change decimal to hex, split per aggregated site: [event, site, chan]
+            nsites = int(len(self.get_aggregator_sites()))
+            ll = int(nchan/nsites)
+            if return_hex_string == 1 and ll and nchan % ll == 0:
+                return [indices, _hex_dump(event_samples, nchan//ll)]
+
+            hex_samples = np.char.mod('0x%08X', event_samples.astype(np.uint32, copy=False))
+            if ll and nchan % ll == 0:
+                event_samples = hex_samples.reshape(len(hex_samples), nchan//ll, ll)
+            else:
+                event_samples = [[row[i:i + ll] for i in range(0, nchan, ll)] for row in hex_samples]
 
             if return_hex_string == 1:
                 # Make a single string containing the hex values.
-                es_string = ""
-                for num, sample in enumerate(event_samples):
+                parts = []
+                for sample in event_samples:
                     for i in range(len(sample[0])):
-                        for x in event_samples[num]:
-                            es_string = es_string + str(x[i]) + " "
-                        es_string = es_string + "\n"
-                    es_string = es_string + "\n"
-                event_samples = es_string
+                        for x in sample:
+                            parts.append(str(x[i]))
+                            parts.append(" ")
+                        parts.append("\n")
+                    parts.append("\n")
+                event_samples = "".join(parts)
 
         return [indices, event_samples]
 
-    def stream(self, recvlen=4096*32, port=AcqPorts.STREAM, data_size=2):
+    def stream(self, recvlen=4096*32, port=AcqPorts.STREAM, data_size=2, reuse=False, nbufs=1):
         """Runs stream and yields data buffers
 
         Args:
             recvlen (_type_, optional): buffer size. Defaults to 4096*32.
             port (_type_, optional): uut port. Defaults to AcqPorts.STREAM value.
             data_size (int, optional): data size in bytes. Defaults to 2.
+            reuse (bool, optional): yield views of the one receive buffer, no allocation per buffer. \
+            Each view is only valid until the next buffer is requested. Defaults to False (copy).
+            nbufs (int, optional): with reuse, receive into a ring of nbufs preallocated buffers, \
+            so each view stays valid until nbufs-1 further buffers are requested. Defaults to 1.
 
         Yields:
             ndarray: data buffer
         """
         dtype = np.dtype('i4' if data_size == 4 else 'i2')   # hmm, what if unsigned?
-        self.stream_nc = netclient.Netclient(self.uut, port)
+        recv_flags = self.stream_socket(port).recv_flags
+
+        def frame(pos):
+            if reuse:
+                return np.frombuffer(buf, dtype, count=pos//dtype.itemsize)
+            return np.frombuffer(buf[:pos], dtype)
 
-        buf = bytearray(recvlen*data_size)
+        ring = [bytearray(recvlen*data_size) for _ in range(max(1, nbufs) if reuse else 1)]
+        islot = 0
         while self.stream_nc:
+            buf = ring[islot]
+            islot = (islot + 1) % len(ring)
             view = memoryview(buf).cast('B')
             pos = 0
 
             while len(view) and self.stream_nc:
-                nrx = self.stream_nc.sock.recv_into(view)
+                # MSG_WAITALL: fills the buffer in one call, short only at close or on a signal
+                nrx = self.stream_nc.sock.recv_into(view, len(view), recv_flags)
                 if nrx == 0:
-                    yield np.frombuffer(buf[:pos], dtype)
+                    yield frame(pos)
                     pos = 0
                 else:
                     view = view[nrx:]
                     pos += nrx
-            yield np.frombuffer(buf[:pos], dtype)
+            yield frame(pos)
+    def stream_socket(self, port=AcqPorts.STREAM):
+        """connects the stream port for callers that move the data themselves (eg splice to disk)
+
+        Args:
+            port (int, optional): uut port. Defaults to AcqPorts.STREAM value.
+
+        Returns:
+            StreamClient: connected client, shut down by stream_close()
+        """
+        self.stream_nc = StreamClient(self.uut, port)
+        return self.stream_nc
+
     def stream_close(self):
             if self.stream_nc:
                 self.stream_nc.close()
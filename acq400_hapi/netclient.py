@@ -37,6 +37,7 @@ class Netclient:
 
     trace = int(os.getenv("NETCLIENT_TRACE", "0"))
     connect_timeout = int(os.getenv("NETCLIENT_CONNECT_TO", "0"))
+    rcvbuf = 0          # SO_RCVBUF, set before connect so window scaling applies. 0: system default
 
     def receive_message(self, termex, maxlen=4096):
         """Read the information from the socket line at a time.
@@ -84,9 +85,15 @@ class Netclient:
             self.sock = socket.socket()
             if Netclient.connect_timeout:
                 self.sock.settimeout(Netclient.connect_timeout);
+            if self.rcvbuf:
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
             if Netclient.trace > 1:
                 print("Netclient(%s, %d) connect" % (self.__addr, self.__port))
             self.sock.connect((self.__addr, self.__port))
+            # small command/reply traffic: no Nagle delay on writes, no delayed ACK where supported
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, "TCP_QUICKACK"):
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
         except socket.error as e:
             print("Netclient {}.{} connect fail {}".format(addr, port, e))
             raise e
@@ -131,13 +138,32 @@ class Netclient:
 
 class Logclient(Netclient):
     """Netclient optimised for logging, line by line"""
+    termex = re.compile("(\r\n)")
+
     def __init__(self, addr, port):
        Netclient.__init__(self,addr, port)
-       self.termex = re.compile("(\r\n)")
 
     def poll(self):
         return self.receive_message(self.termex)
 
+    def poll_lines(self, maxlen=4096):
+        """single recv for use when the socket is known readable (eg from a selector).
+
+        Returns:
+            list of complete lines received, None at end of connection
+        """
+        rx = self.sock.recv(maxlen)
+        if not rx:
+            return None
+        self.buffer += rx.decode("latin-1")
+        lines = []
+        match = self.termex.search(self.buffer)
+        while match != None:
+            lines.append(self.buffer[:match.start(1)])
+            self.buffer = self.buffer[match.end(1):]
+            match = self.termex.search(self.buffer)
+        return lines
+
 
 
 
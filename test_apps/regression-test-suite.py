@@ -24,6 +24,7 @@ import numpy as np
 import os
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 from future import builtins
 import matplotlib.pyplot as plt
@@ -171,7 +172,8 @@ def check_master_slave(args, uut):
 def check_es(events):
     success_flag = True
     for uut_es in events:
-        if uut_es == events[0]:
+        # indices are an ndarray, hex dump a string
+        if np.array_equal(uut_es[0], events[0][0]) and uut_es[1] == events[0][1]:
             continue
         else:
             print("\nES comparison FAILED!\n")
@@ -193,9 +195,16 @@ def show_es(events, uuts):
 
 
 def save_data(uuts):
-    for uut in uuts:
-        data = uut.read_muxed_data()
-        data[0].tofile("{}_shot_data".format(uut.s0.HN))
+    # uploads are network bound: pull all uuts at once, then write each buffer in one go
+    def fetch(uut):
+        return uut.s0.HN, np.ascontiguousarray(uut.read_muxed_data())
+
+    with ThreadPoolExecutor(max_workers=max(1, len(uuts))) as ex:
+        results = list(ex.map(fetch, uuts))
+
+    for hn, data in results:
+        with open("{}_shot_data".format(hn), "wb") as f:
+            f.write(memoryview(data).cast('B'))
     return None
 
 
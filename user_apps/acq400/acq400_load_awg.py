@@ -67,17 +67,6 @@ def timing(f):
     return wrap
 
 
-def file_extender(fd, ext_count):
-    buf = fd.read()
-    buf0 = buf
-
-    while ext_count > 1:
-        buf += buf0
-        ext_count -= 1
-        
-    return buf
-        
-
 @timing
 def load_awg(args, uut, rep):
     acq400_hapi.Acq400UI.exec_args(uut, args)
@@ -89,7 +78,7 @@ def load_awg(args, uut, rep):
         while loaded != 1:
             try:
                 with open(args.file, "rb") as fd:
-                    uut.load_awg(file_extender(fd, args.awg_extend), autorearm=args.mode==2, port=args.port)
+                    uut.load_awg(fd, autorearm=args.mode==2, port=args.port, repeats=max(1, args.awg_extend))
                     loaded = 1
             except Exception as e:
                 if loaded == 0:
@@ -68,6 +68,7 @@ from acq400_hapi.acq400_print import DISPLAY
 
 import multiprocessing as MP
 import threading
+import queue
 
 def make_data_dir(directory, verbose):
     if verbose > 2:
@@ -79,6 +80,49 @@ def make_data_dir(directory, verbose):
             print("Directory already exists")
         pass
 
+O_WRBIN = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+STREAM_NBUFS = 16     # max receive ring slots, each one file (filesize) big
+STREAM_RING_BYTES = int(os.getenv("ACQ400_STREAM_RING", 256<<20))   # memory bound for the ring, per uut
+
+def write_all(fd, buf):
+    """write buf to raw fd, os.write() may be short"""
+    view = memoryview(buf).cast('B')
+    while len(view):
+        view = view[os.write(fd, view):]
+
+SPLICE_CHUNK = 1<<20
+
+class SpliceUnavailable(Exception):
+    """splice(2) refused before any data was saved: use the user space path instead"""
+    pass
+
+def splice_all(sock_fd, pipe, out_fd, nbytes):
+    """move nbytes socket -> pipe -> out_fd inside the kernel, data never enters user space.
+
+    Returns:
+        bytes moved, short only at end of stream
+    """
+    rfd, wfd = pipe
+    done = 0
+    while done < nbytes:
+        n = os.splice(sock_fd, wfd, min(nbytes - done, SPLICE_CHUNK), flags=os.SPLICE_F_MOVE)
+        if n == 0:
+            break
+        while n:
+            nw = os.splice(rfd, out_fd, n, flags=os.SPLICE_F_MOVE)
+            n -= nw
+            done += nw
+    return done
+
+def make_splice_pipe():
+    pipe = os.pipe()
+    try:
+        import fcntl
+        fcntl.fcntl(pipe[1], fcntl.F_SETPIPE_SZ, SPLICE_CHUNK)
+    except (ImportError, AttributeError, OSError):
+        pass                    # default pipe size works, just more splice calls
+    return pipe
+
 def remove_stale_data(args):
     for uut in args.uuts:
         path = os.path.join(args.root, uut)
@@ -141,6 +185,43 @@ class StreamsOne:
         self.log_file = os.path.join(args.root, f"{uut_name}_times.log")
         open(self.log_file, 'w').close()
 
+    def file_writer(self, jobs):
+        """consumer: owns the data files so a slow disk never stalls the socket.
+
+        jobs: (fn, buf) writes buf to fn, None finishes.
+        In combine mode consecutive jobs with the same fn append to one open file.
+        """
+        data_file = None
+        data_fn = None
+        while True:
+            job = jobs.get()
+            try:
+                if job is None:
+                    break
+                if self.write_error:
+                    continue                # drain so the producer never blocks
+                fn, buf = job
+                if not self.args.combine:
+                    # raw fds: one open/write/close per file, no python file object or stdio buffering
+                    fd = os.open(fn, O_WRBIN, 0o644)
+                    try:
+                        write_all(fd, buf)
+                    finally:
+                        os.close(fd)
+                else:
+                    if fn != data_fn:
+                        if data_file is not None:
+                            os.close(data_file)
+                        data_file = os.open(fn, O_WRBIN, 0o644)
+                        data_fn = fn
+                    write_all(data_file, buf)
+            except Exception as err:
+                self.write_error = err
+            finally:
+                jobs.task_done()
+        if data_file is not None:
+            os.close(data_file)
+
     def logtime(self, t0, t1):
         if not self.previous:
             self.previous = t1
@@ -166,16 +247,8 @@ class StreamsOne:
         self.uut = acq400_hapi.factory(self.uut_name)
         threading.Thread(target=self.update_status_forever, daemon=True).start()
         time.sleep(self.delay)
-        cycle = -1
-        fnum = 999       # force initial directory create
-        data_bytes = 0
-        files = 0
-
         signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-        if callback is None:
-            callback = lambda _clidata: False
-
         if self.args.burst_on_demand:
             self.uut.s1.rgm='3,1,1'
             bod_def = self.args.burst_on_demand.split(',')
@@ -191,6 +264,10 @@ class StreamsOne:
                 self.thread.daemon = True
                 self.thread.start()
 
+        # a real callback may act on the file (eg burst_on_demand job): it must be on disk first
+        sync_callback = callback is not None
+        if callback is None:
+            callback = lambda _clidata: False
 
         try:
             if int(self.uut.s0.data32):
@@ -217,14 +294,122 @@ class StreamsOne:
         if self.args.burst_on_demand and self.args.verbose:
             print(f'burst_on_demand RTM_TRANSLEN={self.args.burst_on_demand} netssb={netssb} filesize={self.args.filesize} blen={blen}')
 
+        if self.use_splice():
+            try:
+                reason = self.splice_to(blen * data_size, callback)
+            except SpliceUnavailable as err:
+                print(f"{self.uut_name} splice not available ({err}), falling back to user space")
+                self.uut.stream_close()
+            else:
+                if reason:
+                    self.stop_proccess(reason)
+                return
+
+        # producer (this thread) only receives, file_writer does the disk I/O.
+        # bounded queue: a persistently slow disk backpressures the stream rather than eating memory.
+        # at most maxsize queued + 1 writing + 1 receiving: the stream ring never overwrites a live buffer
+        # large files (filesamples, burst_on_demand) get fewer slots; 3 is the minimum for a queue of 1
+        nbufs = max(3, min(STREAM_NBUFS, STREAM_RING_BYTES // (blen * data_size)))
+        jobs = queue.Queue(maxsize=nbufs-2)
+        self.write_error = None
+        writer = threading.Thread(target=self.file_writer, args=(jobs,), daemon=True)
+        writer.start()
+        try:
+            reason = self.stream_to(jobs, nbufs, blen, data_size, callback, sync_callback)
+        finally:
+            jobs.put(None)
+            writer.join()
+        if reason:
+            self.stop_proccess(reason)
+
+    def use_splice(self):
+        """raw mode: save every byte, nothing looks at the data. Linux only"""
+        return (self.args.splice and self.args.verbose == 0 and not self.args.nowrite
+                and hasattr(os, 'splice'))
+
+    def splice_to(self, nbytes, callback):
+        """raw mode receive loop: splice each file straight from the socket. Returns stop reason or None"""
+        cycle = -1
+        fnum = 999       # force initial directory create
+        data_bytes = 0
+        files = 0
         t_run = 0
-        fn = "no-file"
         data_file = None
+        data_fn = None
+
+        sock = self.uut.stream_socket().sock
+        sock.settimeout(None)       # a timeout makes the fd O_NONBLOCK: splice would fail with EAGAIN
+        sock_fd = sock.fileno()
+        pipe = make_splice_pipe()
+        try:
+            while True:
+                if self.halt.is_set():
+                    return f"{self.uut_name} Stopped"
+
+                if fnum >= self.args.files_per_cycle:
+                    fnum = 0
+                    cycle += 1
+                    root = os.path.join(self.args.root, self.uut_name, "{:06d}".format(cycle))
+                    make_data_dir(root, self.args.verbose)
+                if self.args.combine:
+                    fn = os.path.join(root, f"{0:04d}-{self.args.files_per_cycle:04d}.dat")
+                else:
+                    fn = os.path.join(root, f"{fnum:04d}.dat")
+                if fn != data_fn:
+                    if data_file is not None:
+                        os.close(data_file)
+                    data_file = os.open(fn, O_WRBIN, 0o644)
+                    data_fn = fn
+                    files += 1
+
+                try:
+                    nrx = splice_all(sock_fd, pipe, data_file, nbytes)
+                except OSError as err:
+                    if data_bytes == 0:
+                        raise SpliceUnavailable(err) from err
+                    raise
+                if nrx == 0:
+                    print("Zero length buffer, quit")
+                    return None
+
+                if data_bytes == 0:
+                    t0 = time.time()
+                else:
+                    t_run = self.logtime(t0, time.time()) - t0
+                data_bytes += nrx
 
-        for buf in self.uut.stream(recvlen=blen, data_size=data_size):
+                self.status.set('runtime', f"{t_run:.0f}s")
+                self.status.set('total bytes', f"{data_bytes}")
+                self.status.set('rate', f"{data_bytes / t_run / 0x100000  if t_run else 0:.2f}MB/s")
+                self.status.set('files', f"{files}")
+                fnum += 1
+
+                if callback(fn) or t_run >= self.args.runtime or data_bytes > self.args.totaldata or nrx < nbytes:
+                    break
+        finally:
+            if data_file is not None:
+                os.close(data_file)
+            os.close(pipe[0])
+            os.close(pipe[1])
+
+        return f"{self.uut_name} Finished"
+
+    def stream_to(self, jobs, nbufs, blen, data_size, callback, sync_callback):
+        """receive loop, queues buffers for file_writer. Returns stop reason or None"""
+        cycle = -1
+        fnum = 999       # force initial directory create
+        data_bytes = 0
+        files = 0
+        t_run = 0
+        fn = "no-file"
+
+        # buffers are views into a fixed ring of nbufs slots, no allocation per buffer
+        for buf in self.uut.stream(recvlen=blen, data_size=data_size, reuse=True, nbufs=nbufs):
 
             if self.halt.is_set():
-                self.stop_proccess(f"{self.uut_name} Stopped")
+                return f"{self.uut_name} Stopped"
+            if self.write_error:
+                return f"{self.uut_name} write failed {self.write_error}"
 
             if data_bytes == 0:
                 t0 = time.time()
@@ -235,7 +420,7 @@ class StreamsOne:
 
             if len(buf) == 0:
                 print("Zero length buffer, quit")
-                return
+                return None
             
             self.status.set('runtime', f"{t_run:.0f}s")
             self.status.set('total bytes', f"{data_bytes}")
@@ -246,24 +431,16 @@ class StreamsOne:
                 if fnum >= self.args.files_per_cycle:
                     fnum = 0
                     cycle += 1
-                    if data_file:
-                        data_file.close()
-                        data_file = None
                     root = os.path.join(self.args.root, self.uut_name, "{:06d}".format(cycle))
                     make_data_dir(root, self.args.verbose)
-                
+                    if self.args.combine:
+                        fn = os.path.join(root, f"{0:04d}-{self.args.files_per_cycle:04d}.dat")
+                        files += 1
+
                 if not self.args.combine:
                     fn = os.path.join(root, f"{fnum:04d}.dat")
-                    with open(fn, 'wb') as data_file:
-                        buf.tofile(data_file)
-                    data_file = None
                     files += 1
-                else:
-                    if not data_file:
-                        fn = os.path.join(root, f"{0:04d}-{self.args.files_per_cycle:04d}.dat")
-                        data_file = open(fn, "wb")
-                        files += 1
-                    buf.tofile(data_file)
+                jobs.put((fn, buf))
 
             if self.args.verbose == 0:
                 pass
@@ -275,10 +452,12 @@ class StreamsOne:
                             format(t_run, fn, files, int(data_bytes), int(data_bytes), data_bytes/t_run/0x100000))
             fnum += 1
 
+            if sync_callback:
+                jobs.join()
             if callback(fn) or t_run >= self.args.runtime or data_bytes > self.args.totaldata:
                 break
-        
-        self.stop_proccess(f"{self.uut_name} Finished")
+
+        return f"{self.uut_name} Finished"
 
 def status_cb():
     print("Another one")
@@ -289,6 +468,7 @@ def run_stream_run(args):
         streamer = StreamsOne(args, uut, halt, pipe, delay)
         streamer.run()
 
+    # one independent process per uut: a uut process that dies takes no other stream with it
     recvs = {}
     pss = {}
     delay = 2
@@ -300,6 +480,13 @@ def run_stream_run(args):
         pss[uut].start()
         delay = 0
 
+    monitor_streams(args, recvs, pss, halt)
+
+    for uut, ps in pss.items():
+        ps.join()
+    print('Done')
+
+def monitor_streams(args, recvs, pss, halt):
     D = DISPLAY()
     uut_status = {}
     start_time = time.time()
@@ -311,10 +498,13 @@ def run_stream_run(args):
                     try:
                         uut_status[uut_name] = recvs[uut_name].recv()
                     except EOFError:
-                        try:
-                            uut_status[uut_name]['state'] = 'DEAD'
-                        except:
-                            pass
+                        break
+                status = uut_status.get(uut_name)
+                if ps.exitcode is not None and not (status and status['stopped']):
+                    # exited without reporting 'stopped': crashed, never waits for halt
+                    status = uut_status.setdefault(uut_name, {'state': None, 'stopped': True})
+                    status['state'] = f'DEAD exitcode {ps.exitcode}'
+                    status['stopped'] = True
             D.add_line("")
             D.add_line(f"{{BOLD}}Stream Multi {{RESET}}Runtime: {round(time.time() - start_time)}s")
             for uut, status in uut_status.items():
@@ -338,7 +528,6 @@ def run_stream_run(args):
         D.render_interrupted()
         halt.set()
         print('Keyboard Interrupt')
-    print('Done')
 
 def run_stream_prep(args):
     if args.filesize > args.totaldata:
@@ -373,6 +562,7 @@ def get_parser(parser=None):
     parser.add_argument('--verbose', default=0, type=int, help='Prints status messages as the stream is running')
     parser.add_argument('--display', default=1, type=int, help='Render display')
     parser.add_argument('--combine', default=0, type=int, help='Combine all cycle files into one')
+    parser.add_argument('--splice', default=0, type=int, help='1: with verbose=0, splice socket to file in the kernel (Linux)')
     if is_client:
         parser.add_argument('uuts', nargs='+', help="uuts")
     return parser